@@ -1,24 +1,61 @@
-from resources.auth import Login, Register
+import os
+
+from resources.auth import Login, Logout, Refresh, Register
+from resources.batch import Batch
 from resources.board_collections import *
 from resources.board_resources import *
+from resources.user_collections import UserTasks
+from representations import output_json, output_msgpack
+import slow_requests
 
 from flask import Flask
 from flask_restful import Api
-from flasgger import Swagger
+
+
+def env_flag(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    if normalized in ('1', 'true', 'yes', 'on'):
+        return True
+    if normalized in ('0', 'false', 'no', 'off'):
+        return False
+    raise ValueError('{} must be one of 1/0, true/false, yes/no, on/off - got {!r}.'.format(name, value))
+
 
 app = Flask(__name__)
 api = Api(app)
+api.representations['application/json'] = output_json
+api.representations['application/msgpack'] = output_msgpack
 app.config['SWAGGER'] = {
     'title': 'FlaskBan',
     'uiversion': 3,
 }
-swag = Swagger(app)
+app.config['SERVE_DOCS'] = env_flag('FLASKBAN_SERVE_DOCS', default=True)
+app.config['SLOW_REQUEST_THRESHOLD'] = float(os.environ.get('FLASKBAN_SLOW_REQUEST_MS', '500'))
+app.config['SLOW_REQUEST_QUEUE_SIZE'] = int(os.environ.get('FLASKBAN_SLOW_REQUEST_QUEUE_SIZE', '1000'))
+slow_requests.init_app(app)
+
+if app.config['SERVE_DOCS']:
+    # flasgger pulls in jsonschema, mistune, PyYAML and the Swagger UI assets,
+    # so it is only imported when the docs are actually served.
+    from flasgger import Swagger
+    swag = Swagger(app, template={
+        'consumes': ['application/json', 'application/msgpack'],
+        'produces': ['application/json', 'application/msgpack'],
+    })
 
 api.add_resource(Login, '/auth/login')
 api.add_resource(Register, '/auth/register')
+api.add_resource(Refresh, '/auth/refresh')
+api.add_resource(Logout, '/auth/logout')
 
 api.add_resource(Boards, '/boards')
 api.add_resource(Board, '/boards/<int:board_id>')
+api.add_resource(BoardExport, '/boards/<int:board_id>/export')
+api.add_resource(BoardStats, '/boards/<int:board_id>/stats')
+api.add_resource(BoardImport, '/boards/import')
 
 api.add_resource(Columns, '/boards/<int:board_id>/columns')
 api.add_resource(Column, '/boards/<int:board_id>/columns/<int:column_id>')
@@ -26,5 +63,9 @@ api.add_resource(Column, '/boards/<int:board_id>/columns/<int:column_id>')
 api.add_resource(Tasks, '/boards/<int:board_id>/tasks')
 api.add_resource(Task, '/boards/<int:board_id>/tasks/<int:task_id>')
 
+api.add_resource(UserTasks, '/users/me/tasks')
+
+api.add_resource(Batch, '/batch')
+
 if __name__ == '__main__':
     app.run()
@@ -0,0 +1,82 @@
+"""
+Compares response encoders on synthetic Task and Board payloads.
+
+Payloads follow the Task and Board schemas from the API docs. Every encoder is timed
+on encoding and decoding, and the size of the encoded payload is reported.
+
+Usage (from flaskban-server directory): python benchmarks/encoding.py [columns] [tasks per column]
+"""
+import json
+import random
+import sys
+import timeit
+
+import msgpack
+import ujson
+
+ENCODERS = {
+    'json': (lambda data: json.dumps(data).encode('utf-8'), lambda body: json.loads(body.decode('utf-8'))),
+    'ujson': (lambda data: ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8'),
+              lambda body: ujson.loads(body.decode('utf-8'))),
+    'msgpack': (lambda data: msgpack.packb(data, use_bin_type=True), lambda body: msgpack.unpackb(body, raw=False)),
+}
+
+WORDS = 'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore'.split()
+
+
+def make_task(rng, task_id, column_id):
+    return {
+        'id': task_id,
+        'version': rng.randint(1, 20),
+        'column_id': column_id,
+        'name': ' '.join(rng.choice(WORDS) for _ in range(4)).capitalize(),
+        'description': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(10, 60))),
+        'user_id': rng.choice([None, rng.randint(1, 100)]),
+    }
+
+
+def make_board(columns, tasks_per_column, seed=0):
+    rng = random.Random(seed)
+    task_ids = iter(range(1, columns * tasks_per_column + 1))
+    return {
+        'id': 1,
+        'version': 1,
+        'name': 'Benchmark board',
+        'visibility': 'private',
+        'columns': [{
+            'id': column_id,
+            'version': 1,
+            'name': 'Column {}'.format(column_id),
+            'archive_after_days': None,
+            'tasks': [make_task(rng, next(task_ids), column_id) for _ in range(tasks_per_column)],
+        } for column_id in range(1, columns + 1)],
+    }
+
+
+def best_of(func, arg, repeat=5):
+    timer = timeit.Timer(lambda: func(arg))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(shape, data):
+    print('{} payload'.format(shape))
+    print('{:<10} {:>14} {:>14} {:>12}'.format('encoder', 'encode us', 'decode us', 'bytes'))
+    for name, (encode, decode) in ENCODERS.items():
+        body = encode(data)
+        print('{:<10} {:>14.1f} {:>14.1f} {:>12d}'.format(
+            name, best_of(encode, data) * 1e6, best_of(decode, body) * 1e6, len(body)))
+    print()
+
+
+def main():
+    columns = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    tasks_per_column = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    board = make_board(columns, tasks_per_column)
+    report('Task', board['columns'][0]['tasks'][0])
+    report('TaskList ({} tasks)'.format(tasks_per_column), {'tasks': board['columns'][0]['tasks']})
+    report('Board ({} columns x {} tasks)'.format(columns, tasks_per_column), board)
+
+
+if __name__ == '__main__':
+    main()
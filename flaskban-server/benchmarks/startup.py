@@ -0,0 +1,53 @@
+"""
+Compares cold start time and memory of the app with and without Swagger docs.
+
+Every run imports app.py in a fresh interpreter, once with FLASKBAN_SERVE_DOCS=1
+and once with FLASKBAN_SERVE_DOCS=0, and reports the median import time
+and the peak RSS of the process.
+
+Usage (from flaskban-server directory): python benchmarks/startup.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import json, resource, sys, time
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'import_ms': elapsed * 1000,
+    'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'flasgger_loaded': 'flasgger' in sys.modules,
+}))
+'''
+
+
+def measure(serve_docs, runs):
+    env = dict(os.environ, FLASKBAN_SERVE_DOCS=serve_docs)
+    results = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', PROBE], cwd=SERVER_DIR, env=env)
+        results.append(json.loads(output.decode().splitlines()[-1]))
+    return results
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print('{:<6} {:>14} {:>14} {:>10}'.format('docs', 'import ms', 'max RSS KiB', 'flasgger'))
+    for serve_docs in ('1', '0'):
+        results = measure(serve_docs, runs)
+        print('{:<6} {:>14.1f} {:>14d} {:>10}'.format(
+            serve_docs,
+            statistics.median(r['import_ms'] for r in results),
+            int(statistics.median(r['max_rss_kb'] for r in results)),
+            str(results[0]['flasgger_loaded'])))
+
+
+if __name__ == '__main__':
+    main()
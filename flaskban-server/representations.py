@@ -0,0 +1,92 @@
+import json
+
+import msgpack
+import ujson
+from flask import current_app, make_response, request
+from flask_restful import abort
+
+from slow_requests import timed
+
+
+class Encoded(object):
+    """
+    A response body that is already encoded, e.g. a cached payload, together with its media type.
+    Resources may return it like any other data, also without a status code.
+    """
+
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.mimetype = mimetype
+
+
+DECODERS = {
+    'application/json': lambda body: ujson.loads(body.decode('utf-8')),
+    'application/msgpack': lambda body: msgpack.unpackb(body, raw=False),
+}
+
+
+def encode_json(data):
+    """Encodes data with ujson, or with the standard json module if RESTFUL_JSON settings are configured."""
+    settings = current_app.config.get('RESTFUL_JSON')
+    if settings:
+        return (json.dumps(data, **settings) + '\n').encode('utf-8')
+    return ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+
+
+def encode_msgpack(data):
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def encode(data, mimetype, encoder):
+    """
+    Encodes data with the encoder. Data that is already encoded with the given media type is returned as it is,
+    and data encoded with a different media type is decoded and encoded again.
+    """
+    if isinstance(data, Encoded):
+        if data.mimetype == mimetype:
+            return data.body
+        if data.mimetype not in DECODERS:
+            raise ValueError('Cannot convert {} body to {}.'.format(data.mimetype, mimetype))
+        data = DECODERS[data.mimetype](data.body)
+    with timed('serialization'):
+        return encoder(data)
+
+
+def make_negotiated_response(body, code, headers, etag_suffix=''):
+    """
+    Makes a Flask response with a body whose format was chosen by Accept header. The ETag set by the resource
+    gets the suffix, so that representations in different formats never share an ETag.
+    """
+    resp = make_response(body, code)
+    resp.headers.extend(headers or {})
+    resp.vary.add('Accept')
+    etag, weak = resp.get_etag()
+    if etag is not None and etag_suffix:
+        resp.set_etag(etag + etag_suffix, weak)
+    return resp
+
+
+def output_json(data, code, headers=None):
+    """Makes a Flask response with a JSON encoded body."""
+    return make_negotiated_response(encode(data, 'application/json', encode_json), code, headers)
+
+
+def output_msgpack(data, code, headers=None):
+    """Makes a Flask response with a MessagePack encoded body."""
+    return make_negotiated_response(encode(data, 'application/msgpack', encode_msgpack), code, headers,
+                                    etag_suffix='-msgpack')
+
+
+def request_body():
+    """Decodes the request body, either as MessagePack or as JSON, depending on its content type."""
+    if request.mimetype == 'application/msgpack':
+        body = request.get_data()
+        # msgpack 0.6.0 does not limit container sizes by itself, and no valid body can contain
+        # more elements than it has bytes.
+        limit = len(body)
+        try:
+            return msgpack.unpackb(body, raw=False, max_str_len=limit, max_bin_len=limit, max_array_len=limit,
+                                   max_map_len=limit // 2, max_ext_len=limit)
+        except (TypeError, ValueError, msgpack.exceptions.UnpackException):
+            abort(400, status=400, message='Invalid request body - body is not valid MessagePack.')
+    return request.get_json(force=True)
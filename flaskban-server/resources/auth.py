@@ -6,7 +6,9 @@ class Login(Resource):
         """
         Authenticate user.
         ---
-        description: Supplies registered user with JWT token.
+        description: Supplies registered user with a short-lived JWT token and a refresh token.
+                     When the JWT token expires, a new one can be obtained with the refresh token
+                     without logging in again.
         tags:
           - auth
         parameters:
@@ -30,13 +32,23 @@ class Login(Resource):
                   required: true
         responses:
           200:
-            description: Successful authentication resulting in a JWT token.
+            description: Successful authentication resulting in a JWT token and a refresh token.
             schema:
+              id: Tokens
               properties:
                 jwt:
                   type: string
                   required: true
                   example: eyJh.eyJzdWIiOiIxMjM0NTY3ODkaW4iOnRydWV9.TJVA95OrM7E2cBab30RMHrHDcEfxjoYZg
+                expires_in:
+                  type: integer
+                  required: true
+                  description: Number of seconds after which the JWT token expires.
+                  example: 900
+                refresh_token:
+                  type: string
+                  required: true
+                  example: eyJh.eyJqdGkiOiI5YjFkZWIifQ.lS0Gp9wV7cGmoa3SmWJyvD4S8X2o1nYVr6hT
           401:
             description: Failed authentication.
             schema:
@@ -60,7 +72,7 @@ class Register(Resource):
         """
         Create new account.
         ---
-        description: Creates an account and returns JWT token.
+        description: Creates an account and returns JWT token and refresh token.
         tags:
           - auth
         parameters:
@@ -72,11 +84,73 @@ class Register(Resource):
               $ref: '#/definitions/Credentials'
         responses:
           201:
-            description: Account successfully created. Response contains a JWT to use.
+            description: Account successfully created. Response contains a JWT and a refresh token to use.
             schema:
+              $ref: '#/definitions/Tokens'
+        """
+        pass
+
+
+class Refresh(Resource):
+    def post(self):
+        """
+        Refresh JWT token.
+        ---
+        description: Exchanges a refresh token for a new short-lived JWT token and a new refresh token.
+                     The refresh token used is revoked and cannot be used again.
+        tags:
+          - auth
+        parameters:
+          - in: body
+            name: body
+            required: true
+            schema:
+              id: RefreshToken
               properties:
-                jwt:
+                refresh_token:
                   type: string
                   required: true
+                  example: eyJh.eyJqdGkiOiI5YjFkZWIifQ.lS0Gp9wV7cGmoa3SmWJyvD4S8X2o1nYVr6hT
+        responses:
+          200:
+            description: New tokens.
+            schema:
+              $ref: '#/definitions/Tokens'
+          401:
+            description: Returned when the refresh token is invalid, expired or revoked.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Token invalid: {status: 401, message: Refresh failed - refresh token corrupted.}
+              Token expired: {status: 401, message: Refresh failed - refresh token expired.}
+              Token revoked: {status: 401, message: Refresh failed - refresh token revoked.}
+        """
+        pass
+
+
+class Logout(Resource):
+    def post(self):
+        """
+        Revoke refresh token.
+        ---
+        description: Revokes the refresh token, so no new JWT tokens can be obtained with it.
+                     JWT tokens that were already issued stay valid until they expire.
+        tags:
+          - auth
+        parameters:
+          - in: body
+            name: body
+            required: true
+            schema:
+              $ref: '#/definitions/RefreshToken'
+        responses:
+          204:
+            description: Refresh token revoked. The response has no body.
+          401:
+            description: Returned when the refresh token is invalid.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Token invalid: {status: 401, message: Logout failed - refresh token corrupted.}
         """
         pass
@@ -0,0 +1,109 @@
+from flask_restful import Resource
+
+
+class Batch(Resource):
+    def post(self):
+        """
+        Execute multiple requests at once.
+        ---
+        description: Executes a list of sub-requests against the board, column and task endpoints in a single call.
+                     The JWT token is verified once for the whole batch, and all sub-requests are executed
+                     in one storage transaction, in the order they were given.
+                     Every sub-request gets its own status code and body, as if it was sent separately.
+                     The batch is atomic - if any sub-request fails (responds with status 400 or higher),
+                     the remaining sub-requests are not executed and the changes made by all the previous ones
+                     are rolled back. Sub-requests that were not executed get status 424.
+                     Whether the changes were saved is indicated by the committed field of the response.
+                     Requires a JWT token in Authorization header.
+        tags:
+          - batch
+        security:
+          -
+        parameters:
+          - in: body
+            name: body
+            required: true
+            description: List of sub-requests (up to 50). Paths are relative to the API root.
+                         Authentication endpoints, board export and import, and batch itself cannot be used
+                         in a batch. Sub-requests may have headers - only If-Match and Idempotency-Key are
+                         taken into consideration, with the same meaning as in separate requests.
+                         Other headers are ignored, and Authorization is always taken from the batch request.
+            schema:
+              properties:
+                requests:
+                  type: list
+                  required: true
+                  example: [
+                    {method: GET, path: /boards/1},
+                    {method: GET, path: /boards/1/columns},
+                    {method: GET, path: /boards/1/tasks},
+                    {method: PATCH, path: /boards/1/tasks/3, headers: {If-Match: '"4"'}, body: {column_id: 2}},
+                    {method: PATCH, path: /boards/1/tasks/4, headers: {If-Match: '"2"'}, body: {column_id: 2}}
+                  ]
+        responses:
+          200:
+            description: Batch executed. Responses are returned in the same order as sub-requests.
+                         Every response contains the headers the endpoint returned, e.g. ETag and Location.
+            schema:
+              id: BatchResponse
+              properties:
+                committed:
+                  type: boolean
+                  required: true
+                  description: True if all sub-requests succeeded and their changes were saved,
+                               false if the changes were rolled back.
+                  example: false
+                responses:
+                  type: list
+                  required: true
+                  example: [
+                    {status: 200, headers: {ETag: '"7"'}, body: {id: 1, version: 1, name: "My Wednesday plan",
+                                                                 visibility: public, columns: []}},
+                    {status: 200, headers: {}, body: {columns: []}},
+                    {status: 200, headers: {}, body: {tasks: []}},
+                    {status: 412, headers: {}, body: {
+                      status: 412,
+                      message: 'Precondition failed - task with id 3 was modified by another request.'
+                    }},
+                    {status: 424, headers: {}, body: {status: 424, message: 'Not executed - sub-request 4 failed.'}}
+                  ]
+          400:
+            description: Returned when the batch is malformed, is too big or contains unsupported paths.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Too many requests: {
+                status: 400,
+                message: 'Invalid batch - at most 50 sub-requests are allowed.'
+              }
+              Unsupported path: {
+                status: 400,
+                message: 'Invalid batch - /auth/login cannot be used in a batch.'
+              }
+              Nested batch: {
+                status: 400,
+                message: 'Invalid batch - /batch cannot be used in a batch.'
+              }
+              Streaming endpoint: {
+                status: 400,
+                message: 'Invalid batch - /boards/1/export cannot be used in a batch.'
+              }
+          403:
+            description: Returned when JWT token is not present or is invalid.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Token missing: {
+                status: 403,
+                message: 'Access forbidden - JWT token missing.'
+              }
+              Token invalid: {
+                status: 403,
+                message: 'Access forbidden - JWT token corrupted.'
+              }
+              Token expired: {
+                status: 403,
+                message: 'Access forbidden - JWT token expired.'
+              }
+        """
+        pass
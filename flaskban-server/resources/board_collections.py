@@ -20,6 +20,20 @@ class Boards(Resource):
             name: limit
             default: 20
             description: Maximum number of results returned (acceptable values are 1 to 1000).
+          - in: query
+            name: depth
+            type: integer
+            enum: [0, 1, 2]
+            default: 2
+            description: How deep the boards are nested - 0 returns boards without columns,
+                         1 returns columns without tasks, 2 returns columns with tasks.
+          - in: query
+            name: fields
+            type: string
+            description: Comma-separated list of task fields to return, e.g. "id,name,column_id".
+                         If not present, all fields are returned. Task id is always returned.
+                         Only the requested data is read from storage. Ignored if depth is less than 2,
+                         since no tasks are returned then.
         responses:
           200:
             description: List of boards.
@@ -30,13 +44,31 @@ class Boards(Resource):
                   type: list
                   required: true
                   example: [
-                    {id: 1, name: "My Wednesday plan", visibility: public, columns: []},
-                    {id: 2, name: "Christmas preparation", visibility: public, columns: [
-                      {id: 1, name: "To do", tasks: [
-                        {id: 1, column_id: 1, user_id: 3, name: 'Dress the Christmas tree'}
+                    {id: 1, version: 1, name: "My Wednesday plan", visibility: public, columns: []},
+                    {id: 2, version: 3, name: "Christmas preparation", visibility: public, columns: [
+                      {id: 1, version: 1, name: "To do", tasks: [
+                        {id: 1, version: 2, column_id: 1, user_id: 3, name: 'Dress the Christmas tree'}
                       ]}
                     ]}
                   ]
+          400:
+            description: Returned when depth is not one of 0, 1 and 2, or when fields contains an unknown task field,
+                         or when offset or limit is out of range.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Invalid limit: {
+                status: 400,
+                message: 'Invalid parameter - limit must be between 1 and 1000.'
+              }
+              Invalid depth: {
+                status: 400,
+                message: 'Invalid parameter - depth must be 0, 1 or 2.'
+              }
+              Unknown field: {
+                status: 400,
+                message: 'Invalid parameter - task has no field named colour.'
+              }
         """
         pass
 
@@ -52,6 +84,14 @@ class Boards(Resource):
         security:
           -
         parameters:
+          - in: header
+            name: Idempotency-Key
+            type: string
+            description: Unique key chosen by the client, e.g. a random UUID. If the same user already sent a request
+                         with the same key to the same URL, its response is returned again
+                         and the board is not created twice. Keys are remembered for up to 24 hours, in memory
+                         of the server process that handled the request, so a retry handled by another process
+                         is executed again.
           - in: body
             name: body
             schema:
@@ -81,6 +121,12 @@ class Boards(Resource):
                   type: integer
                   required: true
                   example: 1
+                version:
+                  type: integer
+                  required: true
+                  example: 1
+                  description: Version of the board, incremented on every modification of the board
+                               itself (not of its columns or tasks).
                 name:
                   type: string
                   required: true
@@ -111,6 +157,30 @@ class Boards(Resource):
                 status: 403,
                 message: 'Access forbidden - JWT token expired.'
               }
+          422:
+            description: Returned when the idempotency key was already used with a different request body.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Key reused: {
+                status: 422,
+                message: 'Idempotency key reused - key was already used with a different request body.'
+              }
+          429:
+            description: Returned when a request with the same idempotency key is still being handled.
+                         The request should be retried after the time given in Retry-After header.
+            headers:
+              Retry-After:
+                type: integer
+                example: 1
+                description: Number of seconds after which the request should be retried.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Request in progress: {
+                status: 429,
+                message: 'Request in progress - request with the same idempotency key has not finished yet.'
+              }
         """
         pass
 
@@ -142,9 +212,10 @@ class Columns(Resource):
                   type: list
                   required: true
                   example: [
-                    {id: 1, name: "To do", tasks: []},
-                    {id: 2, name: "In progress", tasks: [
-                      {id: 1, column_id: 2, name: "JWT generation", description: "Authentication feature.", user_id: 4}
+                    {id: 1, version: 1, name: "To do", tasks: []},
+                    {id: 2, version: 2, name: "In progress", tasks: [
+                      {id: 1, version: 5, column_id: 2, name: "JWT generation", description: "Authentication feature.",
+                       user_id: 4}
                     ]}
                   ]
           403:
@@ -197,6 +268,14 @@ class Columns(Resource):
             type: integer
             required: true
             description: ID of the board.
+          - in: header
+            name: Idempotency-Key
+            type: string
+            description: Unique key chosen by the client, e.g. a random UUID. If the same user already sent a request
+                         with the same key to the same URL, its response is returned again
+                         and the column is not created twice. Keys are remembered for up to 24 hours, in memory
+                         of the server process that handled the request, so a retry handled by another process
+                         is executed again.
           - in: body
             name: body
             required: true
@@ -207,6 +286,11 @@ class Columns(Resource):
                   type: string
                   required: true
                   example: To do
+                archive_after_days:
+                  type: integer
+                  example: 30
+                  description: If set, tasks that stay in the column without being modified for that many days
+                               are archived, e.g. in a "Done" column. Tasks in columns without it are never archived.
         responses:
           201:
             description: Column successfully created. Returns the location of newly created column in header,
@@ -224,10 +308,21 @@ class Columns(Resource):
                   type: integer
                   required: true
                   example: 1
+                version:
+                  type: integer
+                  required: true
+                  example: 1
+                  description: Version of the column, incremented on every modification of the column
+                               itself (not of its tasks).
                 name:
                   type: string
                   required: true
                   example: To do
+                archive_after_days:
+                  type: integer
+                  example: null
+                  description: If set, tasks that stay in the column without being modified for that many days
+                               are archived, e.g. in a "Done" column. Tasks in columns without it are never archived.
                 tasks:
                   type: list
                   required: true
@@ -272,6 +367,30 @@ class Columns(Resource):
                 status: 409,
                 message: 'Column creation failed - column with a given name already exists.'
               }
+          422:
+            description: Returned when the idempotency key was already used with a different request body.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Key reused: {
+                status: 422,
+                message: 'Idempotency key reused - key was already used with a different request body.'
+              }
+          429:
+            description: Returned when a request with the same idempotency key is still being handled.
+                         The request should be retried after the time given in Retry-After header.
+            headers:
+              Retry-After:
+                type: integer
+                example: 1
+                description: Number of seconds after which the request should be retried.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Request in progress: {
+                status: 429,
+                message: 'Request in progress - request with the same idempotency key has not finished yet.'
+              }
         """
         pass
 
@@ -282,6 +401,7 @@ class Tasks(Resource):
         List tasks.
         ---
         description: Returns a list of tasks for board with given id, if user requesting it has permissions to do it.
+                     Tasks that were archived are not listed unless explicitly requested.
                      Requires a JWT token in Authorization header.
         tags:
           - task
@@ -293,6 +413,12 @@ class Tasks(Resource):
             type: integer
             required: true
             description: ID of the board.
+          - in: query
+            name: archived
+            type: boolean
+            default: false
+            description: If true, only archived tasks are listed instead of the active ones.
+                         Only tasks in columns with archive_after_days set are ever archived.
         responses:
           200:
             description: List of tasks.
@@ -303,8 +429,9 @@ class Tasks(Resource):
                   type: list
                   required: true
                   example: [
-                    {id: 1, column_id: 2, name: "JWT generation", description: "Authentication feature.", user_id: 4},
-                    {id: 2, column_id: 1, name: "Finish the docs"}
+                    {id: 1, version: 5, column_id: 2, name: "JWT generation", description: "Authentication feature.",
+                     user_id: 4},
+                    {id: 2, version: 1, column_id: 1, name: "Finish the docs"}
                   ]
           403:
             description: Returned when user has no permissions to list the tasks
@@ -358,6 +485,14 @@ class Tasks(Resource):
             type: integer
             required: true
             description: ID of the board.
+          - in: header
+            name: Idempotency-Key
+            type: string
+            description: Unique key chosen by the client, e.g. a random UUID. If the same user already sent a request
+                         with the same key to the same URL, its response is returned again
+                         and the task is not created twice. Keys are remembered for up to 24 hours, in memory
+                         of the server process that handled the request, so a retry handled by another process
+                         is executed again.
           - in: body
             name: body
             required: true
@@ -400,6 +535,13 @@ class Tasks(Resource):
                   type: integer
                   required: true
                   example: 1
+                version:
+                  type: integer
+                  required: true
+                  example: 1
+                  description: Version of the task, incremented on every modification of the task.
+                               The ETag of the task is its version in quotes, so it can be sent in If-Match header
+                               straight from listings.
                 name:
                   type: string
                   required: true
@@ -446,6 +588,7 @@ class Tasks(Resource):
               }
           409:
             description: Returned when task with given name already exists within the column.
+                         Archived tasks are not taken into account.
             schema:
               $ref: '#/definitions/Error'
             examples:
@@ -453,5 +596,115 @@ class Tasks(Resource):
                 status: 409,
                 message: 'Task creation failed - task with a given name already exists within column with id 1.'
               }
+          422:
+            description: Returned when the idempotency key was already used with a different request body.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Key reused: {
+                status: 422,
+                message: 'Idempotency key reused - key was already used with a different request body.'
+              }
+          429:
+            description: Returned when a request with the same idempotency key is still being handled.
+                         The request should be retried after the time given in Retry-After header.
+            headers:
+              Retry-After:
+                type: integer
+                example: 1
+                description: Number of seconds after which the request should be retried.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Request in progress: {
+                status: 429,
+                message: 'Request in progress - request with the same idempotency key has not finished yet.'
+              }
+        """
+        pass
+
+
+class BoardImport(Resource):
+    def post(self):
+        """
+        Import a board.
+        ---
+        description: Creates a new board from a stream in the format returned by board export,
+                     and makes the user who imported it an administrator of the board.
+                     The stream is processed row by row, and columns and tasks are inserted in bulk,
+                     so the name uniqueness rules are checked for the whole board at once
+                     instead of for every task separately. IDs from the stream are not preserved.
+                     The imported board grants permissions only to the user who imported it, so tasks assigned
+                     to other users are imported without user_id, instead of being rejected.
+                     Columns keep their archive_after_days, and tasks with the archived field set to true
+                     are imported directly into the archive.
+                     Requires a JWT token in Authorization header.
+        tags:
+          - board
+        security:
+          -
+        consumes:
+          - application/x-ndjson
+          - application/gzip
+        parameters:
+          - in: body
+            name: body
+            required: true
+            description: Newline-delimited JSON stream, optionally gzip-compressed (with Content-Type application/gzip).
+                         The first line must describe the board.
+            schema:
+              type: string
+              example: |
+                {"type": "board", "id": 1, "name": "My Wednesday plan", "visibility": "public"}
+                {"type": "column", "id": 1, "name": "To do", "archive_after_days": null}
+                {"type": "column", "id": 2, "name": "Done", "archive_after_days": 30}
+                {"type": "task", "id": 1, "column_id": 1, "name": "Dress the tree", "user_id": 3, "archived": false}
+                {"type": "task", "id": 2, "column_id": 2, "name": "Buy the presents", "archived": true}
+        responses:
+          201:
+            description: Board imported successfully. Returns the location of newly created board in header.
+                         The response has no body.
+            headers:
+              Location:
+                type: string
+                format: uri
+                example: /boards/1
+                description: Location of newly created board.
+          400:
+            description: Returned when the stream is malformed. Nothing is imported in that case.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Malformed stream: {
+                status: 400,
+                message: 'Import failed - line 3 is not a valid board, column or task.'
+              }
+          403:
+            description: Returned when JWT token is not present or is invalid.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Token missing: {
+                status: 403,
+                message: 'Access forbidden - JWT token missing.'
+              }
+              Token invalid: {
+                status: 403,
+                message: 'Access forbidden - JWT token corrupted.'
+              }
+              Token expired: {
+                status: 403,
+                message: 'Access forbidden - JWT token expired.'
+              }
+          409:
+            description: Returned when the stream contains duplicate column names within the board
+                         or duplicate task names within a column.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Duplicate task: {
+                status: 409,
+                message: 'Import failed - task with a given name already exists within column with id 1.'
+              }
         """
         pass
@@ -7,6 +7,7 @@ class Board(Resource):
         Retrieve the board.
         ---
         description: Returns board with given id, if user requesting it has permissions to see it.
+                     Archived tasks are not included.
                      Requires a JWT Token in Authorization header.
         tags:
           - board
@@ -18,11 +19,46 @@ class Board(Resource):
             type: integer
             required: true
             description: ID of the board.
+          - in: query
+            name: depth
+            type: integer
+            enum: [0, 1, 2]
+            default: 2
+            description: How deep the board is nested - 0 returns the board without columns,
+                         1 returns columns without tasks, 2 returns columns with tasks.
+          - in: query
+            name: fields
+            type: string
+            description: Comma-separated list of task fields to return, e.g. "id,name,column_id".
+                         If not present, all fields are returned. Task id is always returned.
+                         Only the requested data is read from storage. Ignored if depth is less than 2,
+                         since no tasks are returned then.
         responses:
           200:
             description: Board object.
+            headers:
+              ETag:
+                type: string
+                example: '"3"'
+                description: Tag of the returned representation.
+                             Changes whenever the board or any of its columns or tasks is modified.
+                             Send it in If-Match header to modify the board.
+                             In MessagePack responses the tag ends with -msgpack.
             schema:
               $ref: '#/definitions/Board'
+          400:
+            description: Returned when depth is not one of 0, 1 and 2, or when fields contains an unknown task field.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Invalid depth: {
+                status: 400,
+                message: 'Invalid parameter - depth must be 0, 1 or 2.'
+              }
+              Unknown field: {
+                status: 400,
+                message: 'Invalid parameter - task has no field named colour.'
+              }
           404:
             description: Returned when no board with given id exists.
             schema:
@@ -74,6 +110,12 @@ class Board(Resource):
             type: integer
             required: true
             description: ID of the board.
+          - in: header
+            name: If-Match
+            type: string
+            description: ETag returned when the board was retrieved or modified. If present, the board is modified
+                         only if neither the board nor any of its columns or tasks has been changed since then.
+                         ETags of both JSON and MessagePack responses are accepted.
           - in: body
             name: body
             description: The only fields taken in consideration are name and visibility. Extra fields are ignored.
@@ -90,6 +132,14 @@ class Board(Resource):
         responses:
           200:
             description: Board modified successfully. Returns the modified board.
+            headers:
+              ETag:
+                type: string
+                example: '"3"'
+                description: Tag of the returned representation.
+                             Changes whenever the board or any of its columns or tasks is modified.
+                             Send it in If-Match header to modify the board.
+                             In MessagePack responses the tag ends with -msgpack.
             schema:
               $ref: '#/definitions/Board'
           404:
@@ -123,6 +173,16 @@ class Board(Resource):
                 status: 403,
                 message: 'Access forbidden - JWT token expired.'
               }
+          412:
+            description: Returned when the board does not match the ETag given in If-Match header anymore.
+                         The board has to be retrieved again before modifying it.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Version conflict: {
+                status: 412,
+                message: 'Precondition failed - board with id 1 was modified by another request.'
+              }
         """
 
     def delete(self, board_id):
@@ -204,6 +264,14 @@ class Column(Resource):
         responses:
           200:
             description: Column successfully retrieved.
+            headers:
+              ETag:
+                type: string
+                example: '"3"'
+                description: Tag of the returned representation.
+                             Changes whenever the column or any of its tasks is modified.
+                             Send it in If-Match header to modify the column.
+                             In MessagePack responses the tag ends with -msgpack.
             schema:
               $ref: '#/definitions/Column'
           403:
@@ -309,10 +377,10 @@ class Column(Resource):
 
     def patch(self):
         """
-        Change the name of the column.
+        Change the name or archiving period of the column.
         ---
         description: Changes the properties of the column, if user has permissions to do it.
-                     Only name can be changed - extra fields are ignored.
+                     Only name and archive_after_days can be changed - extra fields are ignored.
                      Requires a JWT token in Authorization header.
         tags:
           - column
@@ -329,20 +397,40 @@ class Column(Resource):
             type: integer
             required: true
             description: ID of the column.
+          - in: header
+            name: If-Match
+            type: string
+            description: ETag returned when the column was retrieved or modified. If present, the column is modified
+                         only if neither the column nor any of its tasks has been changed since then.
+                         ETags of both JSON and MessagePack responses are accepted.
           - in: body
             name: body
             required: true
-            description: The only field taken in consideration is name. Extra fields are ignored.
-                         If no fields are present, the column is not modified.
+            description: The only fields taken in consideration are name and archive_after_days.
+                         Extra fields are ignored. If no fields are present, the column is not modified.
+                         Setting archive_after_days to null stops archiving tasks in the column.
             schema:
               properties:
                 name:
                   type: string
                   example: Done
+                archive_after_days:
+                  type: integer
+                  example: 30
+                  description: If set, tasks that stay in the column without being modified for that many days
+                               are archived, e.g. in a "Done" column. Tasks in columns without it are never archived.
         responses:
         responses:
           200:
             description: Column modified successfully. Returns the modified column.
+            headers:
+              ETag:
+                type: string
+                example: '"3"'
+                description: Tag of the returned representation.
+                             Changes whenever the column or any of its tasks is modified.
+                             Send it in If-Match header to modify the column.
+                             In MessagePack responses the tag ends with -msgpack.
             schema:
               $ref: '#/definitions/Column'
           404:
@@ -380,6 +468,16 @@ class Column(Resource):
                 status: 403,
                 message: 'Access forbidden - JWT token expired.'
               }
+          412:
+            description: Returned when the column does not match the ETag given in If-Match header anymore.
+                         The column has to be retrieved again before modifying it.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Version conflict: {
+                status: 412,
+                message: 'Precondition failed - column with id 1 was modified by another request.'
+              }
         """
         pass
 
@@ -409,6 +507,13 @@ class Task(Resource):
         responses:
           200:
             description: Task successfully retrieved.
+            headers:
+              ETag:
+                type: string
+                example: '"3"'
+                description: Tag of the task - its version field in quotes.
+                             Send it in If-Match header to modify the task.
+                             In MessagePack responses the tag ends with -msgpack.
             schema:
               $ref: '#/definitions/Task'
           403:
@@ -434,7 +539,8 @@ class Task(Resource):
                 message: 'Access forbidden - JWT token expired.'
               }
           404:
-            description: Returned when no board or task with given id exists.
+            description: Returned when no board or task with given id exists, or when the task was archived.
+                         Archived tasks can only be listed with Tasks.get.
             schema:
               $ref: '#/definitions/Error'
             examples:
@@ -446,6 +552,10 @@ class Task(Resource):
                 status: 404,
                 message: 'Not found - task with id 1 does not exist.'
               }
+              Archived task: {
+                status: 404,
+                message: 'Not found - task with id 1 is archived.'
+              }
         """
         pass
 
@@ -496,7 +606,8 @@ class Task(Resource):
                 message: 'Access forbidden - JWT token expired.'
               }
           404:
-            description: Returned when no board or task with given id exists.
+            description: Returned when no board or task with given id exists, or when the task was archived.
+                         Archived tasks can only be listed with Tasks.get.
             schema:
               $ref: '#/definitions/Error'
             examples:
@@ -508,6 +619,10 @@ class Task(Resource):
                 status: 404,
                 message: 'Not found - task with id 1 does not exist.'
               }
+              Archived task: {
+                status: 404,
+                message: 'Not found - task with id 1 is archived.'
+              }
         """
         pass
 
@@ -533,6 +648,13 @@ class Task(Resource):
             type: integer
             required: true
             description: ID of the task.
+          - in: header
+            name: If-Match
+            type: string
+            description: ETag returned when the task was retrieved or modified, or the version field of the task
+                         from a listing in quotes (e.g. "5"). If present, the task is modified only if it has not
+                         been changed since then.
+                         ETags of both JSON and MessagePack responses are accepted.
           - in: body
             name: body
             required: true
@@ -557,10 +679,18 @@ class Task(Resource):
         responses:
           200:
             description: Task modified successfully. Returns the modified task.
+            headers:
+              ETag:
+                type: string
+                example: '"3"'
+                description: Tag of the task - its version field in quotes.
+                             Send it in If-Match header to modify the task.
+                             In MessagePack responses the tag ends with -msgpack.
             schema:
               $ref: '#/definitions/Task'
           404:
-            description: Returned when no board or task with given id exists.
+            description: Returned when no board or task with given id exists, or when the task was archived.
+                         Archived tasks can only be listed with Tasks.get.
             schema:
               $ref: '#/definitions/Error'
             examples:
@@ -572,6 +702,10 @@ class Task(Resource):
                 status: 404,
                 message: 'Not found - task with id 1 does not exist.'
               }
+              Archived task: {
+                status: 404,
+                message: 'Not found - task with id 1 is archived.'
+              }
           403:
             description: Returned when user has no permissions to modify the task
                          or when JWT token is not present or is invalid.
@@ -612,5 +746,183 @@ class Task(Resource):
                 status: 409,
                 message: 'Insufficient permissions - user with id 1 cannot be assigned to a task.'
               }
+          412:
+            description: Returned when the task does not match the ETag given in If-Match header anymore.
+                         The task has to be retrieved again before modifying it.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Version conflict: {
+                status: 412,
+                message: 'Precondition failed - task with id 1 was modified by another request.'
+              }
+        """
+        pass
+
+
+class BoardExport(Resource):
+    def get(self, board_id):
+        """
+        Export the board.
+        ---
+        description: Streams the board with all its columns and tasks as newline-delimited JSON,
+                     if user has permissions to see it.
+                     The first line describes the board, and every following line is a single column or task,
+                     with columns always preceding their tasks. Rows are read and written one by one,
+                     so boards of any size can be exported.
+                     Column rows include archive_after_days. Archived tasks are exported as well,
+                     with the archived field set to true.
+                     Requires a JWT token in Authorization header.
+        tags:
+          - board
+        security:
+          -
+        produces:
+          - application/x-ndjson
+          - application/gzip
+        parameters:
+          - in: path
+            name: board_id
+            type: integer
+            required: true
+            description: ID of the board.
+          - in: query
+            name: compression
+            type: string
+            enum: [none, gzip]
+            default: none
+            description: If set to gzip, the stream is gzip-compressed and sent as application/gzip.
+        responses:
+          200:
+            description: Board export stream.
+            examples:
+              application/x-ndjson: |
+                {"type": "board", "id": 1, "name": "My Wednesday plan", "visibility": "public"}
+                {"type": "column", "id": 1, "name": "To do", "archive_after_days": null}
+                {"type": "column", "id": 2, "name": "Done", "archive_after_days": 30}
+                {"type": "task", "id": 1, "column_id": 1, "name": "Dress the tree", "user_id": 3, "archived": false}
+                {"type": "task", "id": 2, "column_id": 2, "name": "Buy the presents", "archived": true}
+          404:
+            description: Returned when no board with given id exists.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              No board: {
+                status: 404,
+                message: 'Not found - board with id 1 does not exist.'
+              }
+          403:
+            description: Returned when user has no permissions to export the board
+                         or when JWT token is not present or is invalid.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              No permission: {
+                status: 403,
+                message: 'Access forbidden - no permission to export the board.'
+              }
+              Token missing: {
+                status: 403,
+                message: 'Access forbidden - JWT token missing.'
+              }
+              Token invalid: {
+                status: 403,
+                message: 'Access forbidden - JWT token corrupted.'
+              }
+              Token expired: {
+                status: 403,
+                message: 'Access forbidden - JWT token expired.'
+              }
+        """
+        pass
+
+
+class BoardStats(Resource):
+    def get(self, board_id):
+        """
+        Retrieve board statistics.
+        ---
+        description: Returns task counts per column and per assignee, and the number of tasks moved into each column
+                     per day, if user requesting it has permissions to see the board.
+                     Archived tasks are not included in the counts per column and per assignee,
+                     but tasks moved in the past still count towards throughput.
+                     The statistics are kept up to date when tasks are created, modified, deleted and archived,
+                     so retrieving them does not depend on the number of tasks in the board.
+                     Requires a JWT token in Authorization header.
+        tags:
+          - board
+        security:
+          -
+        parameters:
+          - in: path
+            name: board_id
+            type: integer
+            required: true
+            description: ID of the board.
+          - in: query
+            name: days
+            type: integer
+            default: 30
+            description: Number of most recent days included in throughput (acceptable values are 1 to 365).
+        responses:
+          200:
+            description: Board statistics.
+            schema:
+              id: BoardStats
+              properties:
+                columns:
+                  type: list
+                  required: true
+                  example: [
+                    {column_id: 1, tasks: 4},
+                    {column_id: 2, tasks: 1}
+                  ]
+                assignees:
+                  type: list
+                  required: true
+                  description: Task counts per user. Tasks with no user assigned are counted under null user_id.
+                  example: [
+                    {user_id: 3, tasks: 2},
+                    {user_id: null, tasks: 3}
+                  ]
+                throughput:
+                  type: list
+                  required: true
+                  description: Number of tasks created in or moved into each column, per day.
+                  example: [
+                    {date: '2018-12-20', column_id: 1, tasks: 3},
+                    {date: '2018-12-21', column_id: 2, tasks: 1}
+                  ]
+          404:
+            description: Returned when no board with given id exists.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              No board: {
+                status: 404,
+                message: 'Not found - board with id 1 does not exist.'
+              }
+          403:
+            description: Returned when user has no permissions to see the board
+                         or when JWT token is not present or is invalid.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              No permission: {
+                status: 403,
+                message: 'Access forbidden - no permission to retrieve the board.'
+              }
+              Token missing: {
+                status: 403,
+                message: 'Access forbidden - JWT token missing.'
+              }
+              Token invalid: {
+                status: 403,
+                message: 'Access forbidden - JWT token corrupted.'
+              }
+              Token expired: {
+                status: 403,
+                message: 'Access forbidden - JWT token expired.'
+              }
         """
         pass
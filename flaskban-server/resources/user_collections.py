@@ -0,0 +1,73 @@
+from flask_restful import Resource
+
+
+class UserTasks(Resource):
+    def get(self):
+        """
+        List tasks assigned to the user.
+        ---
+        description: Returns tasks assigned to the user, across all boards the user has permissions to see.
+                     Tasks from boards the user has lost access to and archived tasks are not listed.
+                     Results are paginated with a cursor - to get the next page, pass next_cursor from
+                     the previous response as the cursor parameter.
+                     Requires a JWT token in Authorization header.
+        tags:
+          - task
+        security:
+          -
+        parameters:
+          - in: query
+            type: string
+            name: cursor
+            description: Cursor returned with the previous page. If not present, the first page is returned.
+          - in: query
+            type: integer
+            name: limit
+            default: 20
+            description: Maximum number of results returned (acceptable values are 1 to 1000).
+        responses:
+          200:
+            description: List of tasks assigned to the user.
+            schema:
+              id: UserTaskList
+              properties:
+                tasks:
+                  type: list
+                  required: true
+                  example: [
+                    {id: 1, version: 5, board_id: 2, column_id: 2, name: "JWT generation",
+                     description: "Authentication feature.", user_id: 4},
+                    {id: 7, version: 1, board_id: 5, column_id: 1, name: "Finish the docs", user_id: 4}
+                  ]
+                next_cursor:
+                  type: string
+                  description: Cursor of the next page. Not present if there are no more tasks.
+                  example: eyJib2FyZF9pZCI6IDUsICJ0YXNrX2lkIjogN30
+          400:
+            description: Returned when the cursor is invalid.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Invalid cursor: {
+                status: 400,
+                message: 'Invalid cursor - cursor could not be decoded.'
+              }
+          403:
+            description: Returned when JWT token is not present or is invalid.
+            schema:
+              $ref: '#/definitions/Error'
+            examples:
+              Token missing: {
+                status: 403,
+                message: 'Access forbidden - JWT token missing.'
+              }
+              Token invalid: {
+                status: 403,
+                message: 'Access forbidden - JWT token corrupted.'
+              }
+              Token expired: {
+                status: 403,
+                message: 'Access forbidden - JWT token expired.'
+              }
+        """
+        pass
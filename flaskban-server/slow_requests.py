@@ -0,0 +1,106 @@
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import g, request
+
+logger = logging.getLogger('flaskban.slow_requests')
+logger.setLevel(logging.WARNING)
+logger.propagate = False
+
+_listener_lock = threading.Lock()
+_listener_pid = None
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Drops records when the queue is full, so logging never blocks or grows without bound."""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """Waits for room in a full queue when stopped, so records queued before exit are still written."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class _ForwardingHandler(logging.Handler):
+    """Passes records to the given logger, so they are written by the handlers configured for it."""
+
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+
+    def emit(self, record):
+        self.target.handle(record)
+
+
+def _start_listener(app):
+    """
+    Starts the background thread writing the log in the current process. When workers are forked from
+    a process that already imported the app, every worker starts its own thread on its first request.
+    """
+    global _listener_pid
+    with _listener_lock:
+        if _listener_pid == os.getpid():
+            return
+        log_queue = queue.Queue(app.config['SLOW_REQUEST_QUEUE_SIZE'])
+        logger.handlers = [_DroppingQueueHandler(log_queue)]
+        listener = _FlushingQueueListener(log_queue, _ForwardingHandler(app.logger))
+        listener.start()
+        _listener_pid = os.getpid()
+        atexit.register(_stop_listener, listener, _listener_pid)
+
+
+def _stop_listener(listener, pid):
+    """Writes the remaining records on exit. Processes forked from this one do not run the listener."""
+    if os.getpid() == pid:
+        listener.stop()
+
+
+def init_app(app):
+    """Logs requests taking longer than SLOW_REQUEST_THRESHOLD milliseconds through the app's logger."""
+    app.config.setdefault('SLOW_REQUEST_THRESHOLD', 500)
+    app.config.setdefault('SLOW_REQUEST_QUEUE_SIZE', 1000)
+
+    @app.before_request
+    def start_timer():
+        if _listener_pid != os.getpid():
+            _start_listener(app)
+        g.request_start = time.perf_counter()
+        g.request_timings = {}
+
+    @app.after_request
+    def log_slow_request(response):
+        start = getattr(g, 'request_start', None)
+        if start is None:
+            return response
+        elapsed = (time.perf_counter() - start) * 1000
+        if elapsed >= app.config['SLOW_REQUEST_THRESHOLD']:
+            timings = g.get('request_timings', {})
+            breakdown = ', '.join('{}={:.1f}ms'.format(phase, ms) for phase, ms in timings.items())
+            logger.warning('Slow request: %s %s (%s) %d took %.1fms [%s]', request.method, request.path,
+                           request.endpoint, response.status_code, elapsed, breakdown)
+        return response
+
+
+@contextmanager
+def timed(phase):
+    """Adds time spent in the block to the given phase (e.g. serialization) of the current request."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        timings = g.setdefault('request_timings', {})
+        timings[phase] = timings.get(phase, 0) + elapsed
@@ -0,0 +1,66 @@
+import msgpack
+import pytest
+from flask import Flask
+from flask_restful import Api, Resource
+from werkzeug.exceptions import HTTPException
+
+from app import app
+from representations import Encoded, output_json, output_msgpack, request_body
+
+
+def decode_msgpack_body(body):
+    with app.test_request_context('/', method='POST', data=body, content_type='application/msgpack'):
+        return request_body()
+
+
+def test_request_body_decodes_msgpack():
+    assert decode_msgpack_body(msgpack.packb({'name': 'To do', 'ids': [1, 2]})) == {'name': 'To do', 'ids': [1, 2]}
+
+
+@pytest.mark.parametrize('body', [
+    b'\x93\x01',  # array missing its elements
+    msgpack.packb(1) + b'\x01',  # extra data
+    b'\xa2\xff\xfe',  # string that is not UTF-8
+    b'\xc1',  # reserved type
+    b'\x81\x91\x01\x02',  # map with an array key
+    b'\xdd\xff\xff\xff\xff',  # array longer than the body
+])
+def test_request_body_rejects_malformed_msgpack(body):
+    with pytest.raises(HTTPException) as error:
+        decode_msgpack_body(body)
+    assert error.value.code == 400
+
+
+@pytest.mark.parametrize('output, etag', [(output_json, '3'), (output_msgpack, '3-msgpack')])
+def test_negotiated_responses_vary_by_accept(output, etag):
+    with app.test_request_context('/'):
+        resp = output({'id': 1}, 200, {'ETag': '"3"'})
+    assert 'Accept' in resp.vary
+    assert resp.get_etag() == (etag, False)
+
+
+class CachedBoard(Resource):
+    def get(self):
+        return Encoded(b'{"id":1}', 'application/json')
+
+
+@pytest.fixture
+def cached_client():
+    cached_app = Flask(__name__)
+    api = Api(cached_app)
+    api.representations['application/json'] = output_json
+    api.representations['application/msgpack'] = output_msgpack
+    api.add_resource(CachedBoard, '/cached')
+    return cached_app.test_client()
+
+
+def test_encoded_body_is_passed_through(cached_client):
+    resp = cached_client.get('/cached', headers={'Accept': 'application/json'})
+    assert resp.status_code == 200
+    assert resp.get_data() == b'{"id":1}'
+
+
+def test_encoded_body_is_converted_to_other_format(cached_client):
+    resp = cached_client.get('/cached', headers={'Accept': 'application/msgpack'})
+    assert resp.status_code == 200
+    assert msgpack.unpackb(resp.get_data(), raw=False) == {'id': 1}
@@ -0,0 +1,19 @@
+from flask import Flask, g
+
+import slow_requests
+from representations import output_json
+
+
+def test_init_app_works_without_config():
+    bare_app = Flask(__name__)
+    slow_requests.init_app(bare_app)
+    bare_app.add_url_rule('/', 'index', lambda: 'ok')
+    assert bare_app.test_client().get('/').status_code == 200
+    assert bare_app.config['SLOW_REQUEST_THRESHOLD'] == 500
+
+
+def test_timed_works_without_start_timer():
+    bare_app = Flask(__name__)
+    with bare_app.test_request_context('/'):
+        output_json({'id': 1}, 200)
+        assert 'serialization' in g.request_timings